@@ -1,30 +1,83 @@
 #!/usr/bin/env python3
 """
 Beispiel für die Verwendung des Website-zu-PDF-Converters als Modul.
+
+Die URLs werden nebenläufig mit aiohttp geladen (die Wartezeit auf das
+Netzwerk überlappt sich), während Bereinigung und PDF-Erstellung als
+CPU-lastige Schritte in einem Prozess-Pool laufen.
 """
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import aiohttp
+
 from scraper import WebsiteToPDF
 
-def main():
-    # Initialisiere den Converter (PDFs werden auf dem Desktop gespeichert)
-    converter = WebsiteToPDF()
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Ein Converter pro Worker-Prozess (wird beim ersten Auftrag angelegt)
+_converter = None
+
+
+async def fetch_async(session, url):
+    """Lädt eine URL asynchron; gibt None bei Fehlern zurück."""
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+    except Exception as e:
+        print(f"Fehler bei {url}: {e}")
+        return None
+
 
+def build_pdf(url, html_content):
+    """Synchroner Worker: Bereinigen + PDF-Erstellung (läuft im Prozess-Pool)."""
+    global _converter
+    if _converter is None:
+        _converter = WebsiteToPDF()
+
+    cleaned_html = _converter.clean_html(html_content, url)
+    filename = _converter.generate_filename(url)
+    _converter.convert_to_pdf(cleaned_html, filename)
+    return _converter.output_dir / filename
+
+
+async def main_async():
     # Beispiel-URLs
     urls = [
         'https://example.com',
         'https://de.wikipedia.org/wiki/Python_(Programmiersprache)',
     ]
 
-    # Verarbeite jede URL
-    for url in urls:
-        try:
-            converter.process_url(url)
-        except Exception as e:
-            print(f"Fehler bei {url}: {e}")
-            continue
+    # Alle URLs gleichzeitig laden
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(timeout=timeout, headers=HEADERS) as session:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_async(session, url)) for url in urls]
+
+    # PDF-Erstellung auf mehrere Prozesse verteilen
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor() as pool:
+        jobs = [
+            loop.run_in_executor(pool, build_pdf, url, task.result())
+            for url, task in zip(urls, tasks)
+            if task.result() is not None
+        ]
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Fehler bei der PDF-Erstellung: {result}")
 
     print("\nAlle URLs wurden verarbeitet!")
 
 
+def main():
+    asyncio.run(main_async())
+
+
 if __name__ == "__main__":
     main()
@@ -7,6 +7,17 @@ FIX: Add this to web_scraper_pro.py to fix ChromeDriver issues on Windows
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Resolve the ChromeDriver path once per process; ChromeDriverManager().install()
+# does network/version checks on every call otherwise
+_CHROMEDRIVER_PATH = None
+
+
+def _get_chromedriver_path():
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    return _CHROMEDRIVER_PATH
+
 # Replace the setup_driver() method with this:
 
 def setup_driver(self) -> webdriver.Chrome:
@@ -52,7 +63,7 @@ def setup_driver(self) -> webdriver.Chrome:
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
         # Use webdriver-manager to automatically handle ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(_get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
 
         driver.set_page_load_timeout(self.config.timeout)
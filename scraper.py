@@ -7,12 +7,57 @@ Lädt eine Website herunter, bereinigt den HTML-Inhalt und speichert ihn als PDF
 import os
 import sys
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
+from bs4 import BeautifulSoup, Comment
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 from pathlib import Path
 from datetime import datetime
 import re
 
+# Vorkompilierte Muster für die Dateinamen-Erzeugung
+_SCHEME_RE = re.compile(r'https?://(www\.)?')
+_SAFE_RE = re.compile(r'[^\w\-_\.]')
+
+# Maximale Antwortgröße beim Download (Schutz vor Speicherfressern)
+_MAX_RESPONSE_BYTES = 20 * 1024 * 1024  # 20 MB
+
+# CSS für bessere PDF-Formatierung
+_PDF_CSS = """
+@page {
+    margin: 2cm;
+    size: A4;
+}
+body {
+    font-family: 'Arial', 'Helvetica', sans-serif;
+    font-size: 12pt;
+    line-height: 1.6;
+    color: #333;
+}
+h1, h2, h3, h4, h5, h6 {
+    color: #2c3e50;
+    margin-top: 1em;
+    margin-bottom: 0.5em;
+}
+h1 { font-size: 24pt; }
+h2 { font-size: 20pt; }
+h3 { font-size: 16pt; }
+img {
+    max-width: 100%;
+    height: auto;
+}
+a {
+    color: #3498db;
+    text-decoration: none;
+}
+pre, code {
+    background-color: #f4f4f4;
+    padding: 0.5em;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+}
+"""
+
 
 class WebsiteToPDF:
     def __init__(self, output_dir=None):
@@ -40,6 +85,25 @@ class WebsiteToPDF:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         print(f"✓ Ausgabeordner: {self.output_dir}")
 
+        # Font-Konfiguration und Stylesheet einmal aufbauen und für alle PDFs
+        # wiederverwenden (erspart WeasyPrint Font-Suche und CSS-Parsing pro Aufruf)
+        self.font_config = FontConfiguration()
+        self.stylesheet = CSS(string=_PDF_CSS, font_config=self.font_config)
+
+        # Eine Session mit Keep-Alive und Connection-Pooling für alle Downloads
+        # (erspart den TCP/TLS-Handshake pro URL bei Mehrseiten-Crawls)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+
     def fetch_website(self, url):
         """
         Lädt den HTML-Inhalt einer Website herunter.
@@ -56,15 +120,24 @@ class WebsiteToPDF:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            print(f"✓ Website erfolgreich geladen ({len(response.content)} bytes)")
-            return response.text
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                # Body in Blöcken lesen und die Gesamtgröße begrenzen
+                chunks = []
+                total = 0
+                for chunk in response.iter_content(65536):
+                    total += len(chunk)
+                    if total > _MAX_RESPONSE_BYTES:
+                        print(f"✗ Website zu groß (> {_MAX_RESPONSE_BYTES // (1024 * 1024)} MB): {url}")
+                        sys.exit(1)
+                    chunks.append(chunk)
+
+                encoding = response.encoding or 'utf-8'
+
+            print(f"✓ Website erfolgreich geladen ({total} bytes)")
+            return b''.join(chunks).decode(encoding, 'replace')
         except requests.exceptions.RequestException as e:
             print(f"✗ Fehler beim Laden der Website: {e}")
             sys.exit(1)
@@ -81,19 +154,23 @@ class WebsiteToPDF:
             Bereinigter HTML-String
         """
         print("Bereinige HTML-Inhalt...")
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
 
         # Entferne Scripts, Styles, und andere nicht-sichtbare Elemente
-        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'iframe', 'noscript']):
+        # (per CSS-Selektor, damit das Matching im C-Code von lxml/soupsieve läuft)
+        for element in soup.select('script, style, nav, footer, header, iframe, noscript'):
             element.decompose()
 
         # Entferne HTML-Kommentare
-        for comment in soup.find_all(string=lambda text: isinstance(text, type(soup.find_all(string=True)[0])) and text.strip().startswith('<!--')):
+        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
             comment.extract()
 
-        # Entferne leere Elemente
-        for element in soup.find_all():
-            if not element.get_text(strip=True) and not element.find_all(['img', 'video', 'audio']):
+        # Entferne leere Elemente: rückwärts über die Descendants (= Post-Order),
+        # so werden Blätter zuerst entfernt und jeder Eltern-Check bleibt O(1)
+        for element in reversed(list(soup.descendants)):
+            if (getattr(element, 'name', None)
+                    and not element.contents
+                    and element.name not in ('img', 'video', 'audio', 'br', 'hr')):
                 element.decompose()
 
         # Erstelle ein sauberes HTML-Dokument
@@ -113,7 +190,7 @@ class WebsiteToPDF:
             clean_soup.body.append(soup)
 
         print("✓ HTML bereinigt")
-        return str(clean_soup.prettify())
+        return str(clean_soup)
 
     def generate_filename(self, url):
         """
@@ -126,8 +203,8 @@ class WebsiteToPDF:
             Dateiname für das PDF
         """
         # Extrahiere Domain aus URL
-        domain = re.sub(r'https?://(www\.)?', '', url)
-        domain = re.sub(r'[^\w\-_\.]', '_', domain)
+        domain = _SCHEME_RE.sub('', url)
+        domain = _SAFE_RE.sub('_', domain)
         domain = domain[:50]  # Begrenze Länge
 
         # Zeitstempel
@@ -146,46 +223,13 @@ class WebsiteToPDF:
         output_path = self.output_dir / output_filename
         print(f"Erstelle PDF: {output_path}")
 
-        # CSS für bessere PDF-Formatierung
-        css_string = """
-        @page {
-            margin: 2cm;
-            size: A4;
-        }
-        body {
-            font-family: 'Arial', 'Helvetica', sans-serif;
-            font-size: 12pt;
-            line-height: 1.6;
-            color: #333;
-        }
-        h1, h2, h3, h4, h5, h6 {
-            color: #2c3e50;
-            margin-top: 1em;
-            margin-bottom: 0.5em;
-        }
-        h1 { font-size: 24pt; }
-        h2 { font-size: 20pt; }
-        h3 { font-size: 16pt; }
-        img {
-            max-width: 100%;
-            height: auto;
-        }
-        a {
-            color: #3498db;
-            text-decoration: none;
-        }
-        pre, code {
-            background-color: #f4f4f4;
-            padding: 0.5em;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }
-        """
-
         try:
             HTML(string=html_content).write_pdf(
                 output_path,
-                stylesheets=[CSS(string=css_string)]
+                stylesheets=[self.stylesheet],
+                font_config=self.font_config,
+                optimize_images=True,
+                jpeg_quality=80
             )
             print(f"✓ PDF erfolgreich erstellt: {output_path}")
         except Exception as e: